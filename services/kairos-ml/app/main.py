@@ -14,12 +14,12 @@ from __future__ import annotations
 import logging
 import os
 import warnings
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 # Suppress verbose logging from libraries
@@ -29,11 +29,19 @@ logging.getLogger("neuralprophet").setLevel(logging.WARNING)
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 
-app = FastAPI(title="Kairos ML Service", version="1.0.0")
+app = FastAPI(
+    title="Kairos ML Service",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Supported models
 ModelName = Literal["ETS", "PROPHET", "ARIMA", "THETA", "NEURALPROPHET"]
 
+# Epoch seconds representable as ISO 8601 timestamps (0001-01-01 .. 9999-12-31 UTC)
+MIN_EPOCH_SECONDS = -62135596800
+MAX_EPOCH_SECONDS = 253402300799
+
 # ============================================================================
 # Pydantic Models
 # ============================================================================
@@ -108,14 +116,17 @@ class BatchForecastResponse(BaseModel):
 # ============================================================================
 
 
-def iso_from_seconds(seconds: int) -> str:
-    """Convert epoch seconds to ISO 8601 string with Z suffix."""
-    return (
-        datetime.fromtimestamp(seconds, tz=timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+def iso_from_seconds_array(seconds: np.ndarray) -> List[str]:
+    """Convert an array of epoch seconds to ISO 8601 strings with Z suffix."""
+    return [f"{s}Z" for s in np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s")]
+
+
+def finite_or_none(value: Optional[float]) -> Optional[float]:
+    """Return value as a float, or None when it is missing or not finite."""
+    if value is None:
+        return None
+    value = float(value)
+    return value if np.isfinite(value) else None
 
 
 def infer_step_seconds(ds: List[int]) -> int:
@@ -123,20 +134,13 @@ def infer_step_seconds(ds: List[int]) -> int:
     if len(ds) < 2:
         return 60 * 60 * 24  # Default to 1 day
 
-    diffs: List[int] = []
-    for i in range(1, len(ds)):
-        diff = ds[i] - ds[i - 1]
-        if diff > 0:
-            diffs.append(diff)
+    diffs = np.diff(np.asarray(ds, dtype=np.int64))
+    diffs = diffs[diffs > 0]
 
-    if not diffs:
+    if diffs.size == 0:
         return 60 * 60 * 24
 
-    diffs.sort()
-    mid = len(diffs) // 2
-    if len(diffs) % 2 == 1:
-        return diffs[mid]
-    return int((diffs[mid - 1] + diffs[mid]) / 2)
+    return int(np.median(diffs))
 
 
 def infer_frequency(step_seconds: int) -> str:
@@ -556,12 +560,15 @@ def forecast(req: ForecastRequest) -> ForecastResponse:
 
 @app.post("/v1/forecast/batch", response_model=BatchForecastResponse)
 def forecast_batch(req: BatchForecastRequest) -> BatchForecastResponse:
-    return BatchForecastResponse(
-        items=[
-            BatchForecastResponseItem(id=item.id, **run_forecast(item).model_dump())
-            for item in req.items
-        ]
-    )
+    items: List[BatchForecastResponseItem] = []
+    for item in req.items:
+        result = run_forecast(item)
+        items.append(
+            BatchForecastResponseItem.model_construct(
+                id=item.id, points=result.points, meta=result.meta
+            )
+        )
+    return BatchForecastResponse.model_construct(items=items)
 
 
 def run_forecast(req: ForecastRequest) -> ForecastResponse:
@@ -633,30 +640,48 @@ def run_forecast(req: ForecastRequest) -> ForecastResponse:
         logging.exception(f"Forecast failed for model {req.model}")
         raise HTTPException(status_code=500, detail=f"Forecast failed: {str(e)}")
 
-    # Build response points
-    points: List[ForecastPoint] = []
-    for i, (pred, lower, upper) in enumerate(zip(yhat, yhat_lower, yhat_upper), start=1):
-        points.append(
-            ForecastPoint(
-                t=iso_from_seconds(last_ds + step * i),
-                yhat=float(pred) if pred is not None else 0.0,
-                yhatLower=float(lower) if lower is not None else None,
-                yhatUpper=float(upper) if upper is not None else None,
-                isFuture=True,
-            )
+    # Check bounds with Python ints so int64 overflow can't slip through (step is always positive)
+    if yhat and not (
+        MIN_EPOCH_SECONDS <= last_ds + step and last_ds + step * len(yhat) <= MAX_EPOCH_SECONDS
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Forecast timestamps fall outside the supported date range.",
+        )
+
+    # orjson would serialize NaN/Inf as null, so reject non-finite point forecasts explicitly
+    preds = [float(pred) if pred is not None else 0.0 for pred in yhat]
+    if not np.all(np.isfinite(preds)):
+        raise HTTPException(
+            status_code=500,
+            detail=f"Forecast failed: model {req.model} returned non-finite predictions.",
+        )
+
+    # Build response points (values are produced here, so skip pydantic validation)
+    future_ds = last_ds + step * np.arange(1, len(yhat) + 1, dtype=np.int64)
+    timestamps = iso_from_seconds_array(future_ds)
+    points: List[ForecastPoint] = [
+        ForecastPoint.model_construct(
+            t=t,
+            yhat=pred,
+            yhatLower=finite_or_none(lower),
+            yhatUpper=finite_or_none(upper),
+            isFuture=True,
         )
+        for t, pred, lower, upper in zip(timestamps, preds, yhat_lower, yhat_upper)
+    ]
 
     # Compute in-sample metrics (fit on full data, so this is training metrics)
     # For proper evaluation, we'd need a holdout set
     mae, rmse, mape = None, None, None
 
-    return ForecastResponse(
+    return ForecastResponse.model_construct(
         points=points,
-        meta=ForecastMeta(
+        meta=ForecastMeta.model_construct(
             horizon=req.horizon,
             historyCount=len(req.ds),
             intervalLevel=interval_level if any(p.yhatLower is not None for p in points) else None,
-            metrics=ForecastMetrics(
+            metrics=ForecastMetrics.model_construct(
                 sampleCount=len(req.ds),
                 mae=mae,
                 rmse=rmse,